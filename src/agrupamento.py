@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+═══════════════════════════════════════════════════════════════════════════════
+AGRUPAMENTO K-MEANS POR UF - SELEÇÃO DE MUNICÍPIOS REPRESENTATIVOS
+═══════════════════════════════════════════════════════════════════════════════
+
+Versão reutilizável da Estratégia 2 do notebook 01 (clusters K-Means sobre
+indice_final e essenciais_final padronizados), preparada para rodar em todas
+as UFs e a cada nova publicação da ATRICON:
+
+  • semente fixa (CONFIG['SEMENTE']) em todos os ajustes, para que a amostra
+    de municípios seja reprodutível;
+  • varredura de k em paralelo (joblib), escolhendo o k de maior silhueta;
+  • MiniBatchKMeans quando a UF/conjunto tem muitos municípios;
+  • partida a quente: com um agrupamento anterior salvo, os centroides antigos
+    são usados como inicialização e, se poucos municípios mudaram desde o
+    último ajuste do modelo, os que não mudaram mantêm o cluster e só os
+    alterados são reatribuídos.
+
+Autor: Pesquisa Framework LLM-Ready
+Data: Novembro 2025
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import json
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from dataclasses import dataclass, field
+from joblib import Parallel, delayed
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.metrics import silhouette_score
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONFIGURAÇÕES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+CONFIG = {
+    'FEATURES': ['indice_final', 'essenciais_final'],
+    'SEMENTE': 42,
+    'K_MIN': 2,
+    'K_MAX': 8,
+    'N_INIT': 10,
+    'LIMIAR_MINIBATCH': 1000,     # A partir de quantos municípios usar MiniBatchKMeans
+    'AMOSTRA_SILHUETA': 2000,     # Silhueta calculada em amostra acima desse tamanho
+    'LIMIAR_REAGRUPAR': 0.10,     # Fração de municípios alterados que exige novo ajuste
+    'N_JOBS': -1,                 # -1 = todos os núcleos
+    'PASTA_AGRUPAMENTOS': Path(__file__).resolve().parent.parent / 'Data' / 'processed' / 'agrupamentos',
+}
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# AJUSTE E VARREDURA DE K
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _modelo(k, n_amostras, semente, init='k-means++', n_init=None):
+    """KMeans para conjuntos pequenos, MiniBatchKMeans acima do limiar"""
+    n_init = n_init or CONFIG['N_INIT']
+    if n_amostras >= CONFIG['LIMIAR_MINIBATCH']:
+        return MiniBatchKMeans(n_clusters=k, init=init, n_init=n_init,
+                               random_state=semente, batch_size=1024)
+    return KMeans(n_clusters=k, init=init, n_init=n_init, random_state=semente)
+
+def _silhueta(X, rotulos, semente):
+    """Silhueta (em amostra para conjuntos grandes); NaN se houver 1 cluster só"""
+    if len(np.unique(rotulos)) < 2 or len(X) <= len(np.unique(rotulos)):
+        return np.nan
+    amostra = CONFIG['AMOSTRA_SILHUETA'] if len(X) > CONFIG['AMOSTRA_SILHUETA'] else None
+    return float(silhouette_score(X, rotulos, sample_size=amostra, random_state=semente))
+
+def _ajustar_k(X, k, semente):
+    """Ajusta um modelo com k clusters e devolve suas métricas"""
+    modelo = _modelo(k, len(X), semente).fit(X)
+    return {
+        'k': k,
+        'silhueta': _silhueta(X, modelo.labels_, semente),
+        'inercia': float(modelo.inertia_),
+        'centroides': modelo.cluster_centers_,
+        'rotulos': modelo.labels_,
+    }
+
+def varrer_k(X, ks=None, semente=None, n_jobs=None):
+    """
+    Ajusta um modelo para cada k em paralelo. Retorna a lista de resultados
+    (dicts com k, silhueta, inercia, centroides, rotulos) na ordem de `ks`.
+    """
+    ks = ks or range(CONFIG['K_MIN'], CONFIG['K_MAX'] + 1)
+    ks = [k for k in ks if k < len(X)]
+    semente = CONFIG['SEMENTE'] if semente is None else semente
+    n_jobs = CONFIG['N_JOBS'] if n_jobs is None else n_jobs
+    return Parallel(n_jobs=n_jobs)(delayed(_ajustar_k)(X, k, semente) for k in ks)
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# RESULTADO PERSISTIDO
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@dataclass
+class ResultadoAgrupamento:
+    """
+    Agrupamento de uma UF. Os centroides ficam na escala padronizada por
+    `media`/`escala`, que são reaproveitadas na partida a quente para que os
+    centroides do ciclo anterior continuem comparáveis.
+
+    `base_ajuste` guarda as features usadas no último ajuste real do modelo
+    (modos 'completo' e 'partida_quente'); no modo 'incremental' ela é herdada,
+    de modo que a mudança acumulada desde esse ajuste é que decide o reajuste.
+    """
+    uf: str
+    k: int
+    features: list
+    media: np.ndarray
+    escala: np.ndarray
+    centroides: np.ndarray
+    atribuicoes: pd.DataFrame           # índice cod_ibge: features, cluster, distancia
+    silhueta: float = np.nan
+    modo: str = 'completo'              # 'completo', 'partida_quente' ou 'incremental'
+    reaproveitados: int = 0
+    varredura: pd.DataFrame = field(default=None, repr=False)
+    base_ajuste: pd.DataFrame = field(default=None, repr=False)
+
+    def __post_init__(self):
+        if self.base_ajuste is None:
+            self.base_ajuste = self.atribuicoes[self.features].copy()
+
+    def padronizar(self, df):
+        return (df[self.features].to_numpy(np.float64) - self.media) / self.escala
+
+    def salvar(self, pasta=None):
+        """Salva centroides (JSON) e atribuições (CSV) da UF"""
+        pasta = Path(pasta or CONFIG['PASTA_AGRUPAMENTOS'])
+        pasta.mkdir(parents=True, exist_ok=True)
+        metadados = {
+            'uf': self.uf, 'k': self.k, 'features': self.features,
+            'media': self.media.tolist(), 'escala': self.escala.tolist(),
+            'centroides': self.centroides.tolist(),
+            'silhueta': None if np.isnan(self.silhueta) else self.silhueta,
+            'modo': self.modo,
+        }
+        with open(pasta / f'agrupamento_{self.uf}.json', 'w', encoding='utf-8') as f:
+            json.dump(metadados, f, ensure_ascii=False, indent=2)
+        self.atribuicoes.to_csv(pasta / f'agrupamento_{self.uf}.csv', encoding='utf-8-sig')
+        self.base_ajuste.to_csv(pasta / f'agrupamento_{self.uf}_ajuste.csv', encoding='utf-8-sig')
+
+    @classmethod
+    def carregar(cls, uf, pasta=None):
+        """Lê o agrupamento salvo da UF, ou None se não existir"""
+        pasta = Path(pasta or CONFIG['PASTA_AGRUPAMENTOS'])
+        arquivo = pasta / f'agrupamento_{uf}.json'
+        if not arquivo.exists():
+            return None
+        with open(arquivo, encoding='utf-8') as f:
+            m = json.load(f)
+        atribuicoes = pd.read_csv(pasta / f'agrupamento_{uf}.csv', index_col='cod_ibge',
+                                  encoding='utf-8-sig')
+        # Sem o arquivo de ajuste (salvo por versões anteriores), a base é a própria atribuição
+        arquivo_ajuste = pasta / f'agrupamento_{uf}_ajuste.csv'
+        base_ajuste = None
+        if arquivo_ajuste.exists():
+            base_ajuste = pd.read_csv(arquivo_ajuste, index_col='cod_ibge', encoding='utf-8-sig')
+        return cls(uf=m['uf'], k=m['k'], features=m['features'],
+                   media=np.array(m['media']), escala=np.array(m['escala']),
+                   centroides=np.array(m['centroides']), atribuicoes=atribuicoes,
+                   silhueta=np.nan if m['silhueta'] is None else m['silhueta'],
+                   modo=m['modo'], base_ajuste=base_ajuste)
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# AGRUPAMENTO
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _atribuicoes(df, X, centroides, rotulos=None):
+    """Tabela de atribuições com a distância de cada município ao seu centroide"""
+    distancias = np.linalg.norm(X[:, np.newaxis, :] - centroides[np.newaxis, :, :], axis=2)
+    if rotulos is None:
+        rotulos = distancias.argmin(axis=1)
+    tabela = df.copy()
+    tabela['cluster'] = rotulos
+    tabela['distancia'] = distancias[np.arange(len(X)), rotulos]
+    return tabela
+
+def _alterados(df, referencia):
+    """Máscara dos municípios de `df` ausentes ou com features diferentes em `referencia`"""
+    antigos = referencia.reindex(df.index)[df.columns]
+    iguais = np.isclose(antigos.to_numpy(np.float64), df.to_numpy(np.float64)).all(axis=1)
+    return ~iguais
+
+def agrupar(df, uf='BR', features=None, ks=None, anterior=None, semente=None, n_jobs=None):
+    """
+    Agrupa os municípios de `df` (índice = código IBGE) pelas `features`.
+
+    Sem `anterior`, padroniza os dados, varre k e fica com o k de maior
+    silhueta. Com `anterior` (mesmas features):
+      • se até CONFIG['LIMIAR_REAGRUPAR'] dos municípios mudaram desde o
+        último ajuste real (`anterior.base_ajuste`), mantém os centroides e o
+        cluster dos inalterados no último ciclo e reatribui só os alterados;
+      • caso contrário, reajusta com o mesmo k partindo dos centroides antigos.
+    """
+    if features is None:
+        features = anterior.features if anterior is not None else CONFIG['FEATURES']
+    semente = CONFIG['SEMENTE'] if semente is None else semente
+    df = df[features].dropna().astype(np.float64)
+    df.index.name = 'cod_ibge'
+
+    if anterior is not None and list(anterior.features) == list(features):
+        X = anterior.padronizar(df)
+        alterados = _alterados(df, anterior.atribuicoes)
+        alterados_desde_ajuste = _alterados(df, anterior.base_ajuste)
+
+        if alterados_desde_ajuste.mean() <= CONFIG['LIMIAR_REAGRUPAR']:
+            rotulos = anterior.atribuicoes.reindex(df.index)['cluster'].to_numpy()
+            rotulos = np.where(alterados, -1, rotulos)
+            distancias = np.linalg.norm(X[alterados, np.newaxis, :] - anterior.centroides, axis=2)
+            rotulos[alterados] = distancias.argmin(axis=1)
+            rotulos = rotulos.astype(int)
+            return ResultadoAgrupamento(
+                uf=uf, k=anterior.k, features=list(features),
+                media=anterior.media, escala=anterior.escala, centroides=anterior.centroides,
+                atribuicoes=_atribuicoes(df, X, anterior.centroides, rotulos),
+                silhueta=_silhueta(X, rotulos, semente),
+                modo='incremental', reaproveitados=int((~alterados).sum()),
+                base_ajuste=anterior.base_ajuste)
+
+        modelo = _modelo(anterior.k, len(X), semente, init=anterior.centroides, n_init=1).fit(X)
+        return ResultadoAgrupamento(
+            uf=uf, k=anterior.k, features=list(features),
+            media=anterior.media, escala=anterior.escala, centroides=modelo.cluster_centers_,
+            atribuicoes=_atribuicoes(df, X, modelo.cluster_centers_, modelo.labels_),
+            silhueta=_silhueta(X, modelo.labels_, semente), modo='partida_quente')
+
+    media = df.to_numpy().mean(axis=0)
+    escala = df.to_numpy().std(axis=0)
+    escala[escala == 0] = 1.0
+    X = (df.to_numpy() - media) / escala
+
+    resultados = varrer_k(X, ks, semente, n_jobs)
+    if not resultados:
+        raise ValueError(f"Municípios insuficientes para agrupar a UF {uf} ({len(df)})")
+    varredura = pd.DataFrame([{c: r[c] for c in ('k', 'silhueta', 'inercia')} for r in resultados])
+    melhor = resultados[int(varredura['silhueta'].fillna(-1).idxmax())]
+
+    return ResultadoAgrupamento(
+        uf=uf, k=melhor['k'], features=list(features), media=media, escala=escala,
+        centroides=melhor['centroides'],
+        atribuicoes=_atribuicoes(df, X, melhor['centroides'], melhor['rotulos']),
+        silhueta=melhor['silhueta'], varredura=varredura)
+
+def agrupar_por_uf(df, coluna_uf='uf', features=None, ks=None, pasta=None,
+                   salvar=True, n_jobs=None):
+    """
+    Agrupa cada UF separadamente, em paralelo entre UFs. Se houver um
+    agrupamento salvo para a UF em `pasta`, ele é usado como partida a quente.
+    Retorna dict UF -> ResultadoAgrupamento.
+    """
+    n_jobs = CONFIG['N_JOBS'] if n_jobs is None else n_jobs
+    grupos = [(str(uf), grupo) for uf, grupo in df.groupby(coluna_uf, observed=True)]
+
+    def _agrupar_uf(uf, grupo):
+        anterior = ResultadoAgrupamento.carregar(uf, pasta)
+        # Paralelismo já está entre as UFs: a varredura de k de cada UF roda serial
+        return agrupar(grupo, uf=uf, features=features, ks=ks, anterior=anterior, n_jobs=1)
+
+    resultados = Parallel(n_jobs=n_jobs, prefer='threads')(
+        delayed(_agrupar_uf)(uf, grupo) for uf, grupo in grupos)
+    resultados = dict(zip([uf for uf, _ in grupos], resultados))
+
+    if salvar:
+        for resultado in resultados.values():
+            resultado.salvar(pasta)
+    return resultados
+
+def representantes(resultado, n_por_cluster=1):
+    """Municípios mais próximos do centroide de cada cluster"""
+    return (resultado.atribuicoes.sort_values('distancia')
+            .groupby('cluster', group_keys=False).head(n_por_cluster)
+            .sort_values(['cluster', 'distancia']))
+
+def preparar_atricon(df, features=None):
+    """Prefeituras do CSV ATRICON indexadas pelo código IBGE, com UF e features"""
+    features = features or CONFIG['FEATURES']
+    df = df[(df['poder'] == 'E') & (df['esfera'] == 'M')]
+    return df.set_index('ibge')[['uf'] + list(features)]
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FUNÇÃO PRINCIPAL
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main():
+    """Agrupa as prefeituras de todas as UFs com o snapshot ATRICON atual"""
+    import serie_historica as sh
+
+    print("\n" + "="*80)
+    print("📊 Agrupando municípios por UF (K-Means)...")
+    print("="*80)
+
+    resultados = agrupar_por_uf(preparar_atricon(sh.ler_atricon()))
+
+    for uf, r in sorted(resultados.items()):
+        print(f"✓ {uf}: k={r.k}, silhueta={r.silhueta:.3f}, modo={r.modo}, "
+              f"reaproveitados={r.reaproveitados}/{len(r.atribuicoes)}")
+    print(f"\n📂 Agrupamentos salvos em: {CONFIG['PASTA_AGRUPAMENTOS']}")
+
+if __name__ == "__main__":
+    main()
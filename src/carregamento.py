@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+═══════════════════════════════════════════════════════════════════════════════
+CARREGAMENTO CONCORRENTE DAS FONTES BRUTAS
+═══════════════════════════════════════════════════════════════════════════════
+
+Lê em paralelo todas as fontes usadas na pesquisa (formulários de avaliação
+em Excel, estimativas populacionais .xls, população 2024, PIB 2021 e o CSV da
+ATRICON) e devolve um `PacoteDados` quando todas estiverem prontas.
+
+O executor padrão é um pool de threads: o tempo total é dominado por uma
+única planilha (Avaliacao_Municipios_Rondonia.xlsx, ~3 s), e um pool de
+processos não compensa o custo de iniciar os workers e serializar os
+DataFrames. O pool de processos continua disponível (EXECUTOR='processo').
+
+Cada fonte lida é salva em uma cópia pré-processada (pickle) na pasta de
+cache, junto com o caminho, a data de modificação (ns) e o tamanho do arquivo
+original, a identificação da função de leitura e a versão do formato do
+cache. A cópia só é usada quando todos esses dados conferem; se a leitura do
+original falhar, a cópia existente do mesmo leitor e do mesmo caminho é usada
+como alternativa, mesmo que desatualizada. Uma cópia ilegível é ignorada e o
+original é relido. Leitores que não são funções Python (nem `partial` de
+uma) não usam cache.
+
+Autor: Pesquisa Framework LLM-Ready
+Data: Novembro 2025
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import os
+import time
+import functools
+import pickle
+import hashlib
+import tempfile
+import pandas as pd
+from pathlib import Path
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+import serie_historica as sh
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONFIGURAÇÕES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+CONFIG = {
+    'PASTA_FORMULARIOS': sh.PASTA_RAW / 'formularios_transparencia',
+    'PASTA_CACHE': sh.PASTA_RAW.parent / 'cache',
+    'EXECUTOR': 'thread',    # 'thread' ou 'processo'
+    'MAX_WORKERS': None,     # None = padrão do executor (nº de CPUs)
+}
+
+# Incrementar quando o formato das cópias em cache mudar
+VERSAO_CACHE = 2
+
+# Fontes com campo próprio no PacoteDados; as demais vão para `outras`
+FONTES_PACOTE = ('pib', 'populacao_censo', 'populacao_estimada', 'atricon')
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# LEITORES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def ler_formulario(caminho):
+    """Lê todas as abas de uma planilha de avaliação (dict aba -> DataFrame)"""
+    return pd.read_excel(caminho, sheet_name=None)
+
+def fontes_padrao():
+    """
+    Fontes lidas por `carregar_fontes()`: nome -> (função de leitura, caminho).
+    Os formulários entram um por arquivo, ignorando arquivos de trava do Excel (~$).
+    """
+    fontes = {
+        'pib': (sh.ler_pib, sh.CONFIG['ARQUIVO_PIB']),
+        'populacao_censo': (sh.ler_populacao_censo, sh.CONFIG['ARQUIVO_POPULACAO_2024']),
+        'populacao_estimada': (sh.ler_populacao_estimada, sh.CONFIG['ARQUIVO_POPULACAO_2025']),
+        'atricon': (sh.ler_atricon, sh.CONFIG['ARQUIVO_ATRICON']),
+    }
+    for caminho in sorted(Path(CONFIG['PASTA_FORMULARIOS']).glob('*.xlsx')):
+        if not caminho.name.startswith('~$'):
+            fontes[f'formulario:{caminho.stem}'] = (ler_formulario, caminho)
+    return fontes
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CACHE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _caminho_cache(nome, pasta_cache):
+    """Arquivo de cache de uma fonte (':' não é válido em nomes no Windows)"""
+    return Path(pasta_cache) / f"{nome.replace(':', '__')}.pkl"
+
+def _identificar_leitor(leitor):
+    """
+    Nome e assinatura da função de leitura. A assinatura muda quando o código
+    do leitor muda (ex.: outro `header` ou `dtype`), invalidando o cache.
+    Para `functools.partial` inclui os argumentos fixados. Retorna (None, None)
+    para leitores sem código Python identificável (objetos chamáveis, funções
+    embutidas), que então são lidos sempre do original.
+    """
+    if isinstance(leitor, functools.partial):
+        nome, assinatura = _identificar_leitor(leitor.func)
+        if nome is None:
+            return None, None
+        argumentos = repr((leitor.args, sorted(leitor.keywords.items())))
+        conteudo = assinatura + argumentos
+        return f"partial({nome})", hashlib.sha1(conteudo.encode('utf-8')).hexdigest()
+
+    codigo = getattr(leitor, '__code__', None)
+    if codigo is None:
+        return None, None
+    nome = f"{leitor.__module__}.{leitor.__qualname__}"
+    conteudo = repr((codigo.co_code, codigo.co_consts, codigo.co_names, leitor.__defaults__))
+    return nome, hashlib.sha1(conteudo.encode('utf-8')).hexdigest()
+
+def _identificar_arquivo(caminho):
+    """Caminho absoluto, data de modificação (ns) e tamanho do arquivo original"""
+    caminho = Path(caminho).resolve()
+    if not caminho.exists():
+        return {'caminho': str(caminho)}
+    estado = caminho.stat()
+    return {'caminho': str(caminho), 'mtime_ns': estado.st_mtime_ns, 'tamanho': estado.st_size}
+
+def _ler_cache(cache, nome_leitor, arquivo, assinatura=None):
+    """
+    Dados da cópia em cache, ou None se ela não existir, estiver ilegível ou
+    tiver sido gerada por outra versão do cache/leitor ou a partir de outro
+    arquivo. Com `assinatura=None` aceita qualquer versão do mesmo leitor e
+    qualquer versão do arquivo no mesmo caminho (alternativa a falhas).
+    """
+    if not cache.exists():
+        return None
+    try:
+        conteudo = pd.read_pickle(cache)
+    except Exception:
+        return None
+    if not isinstance(conteudo, dict) or conteudo.get('versao') != VERSAO_CACHE \
+            or conteudo.get('leitor') != nome_leitor:
+        return None
+    original = conteudo.get('arquivo') or {}
+    if assinatura is None:
+        if original.get('caminho') != arquivo['caminho']:
+            return None
+    elif conteudo.get('assinatura') != assinatura or original != arquivo:
+        return None
+    return conteudo['dados']
+
+def _gravar_cache(cache, nome_leitor, assinatura, arquivo, dados):
+    """Grava a cópia em arquivo temporário e o move para o destino (operação atômica)"""
+    cache.parent.mkdir(parents=True, exist_ok=True)
+    descritor, temporario = tempfile.mkstemp(dir=cache.parent, suffix='.tmp')
+    try:
+        with os.fdopen(descritor, 'wb') as f:
+            pickle.dump({'versao': VERSAO_CACHE, 'leitor': nome_leitor,
+                         'assinatura': assinatura, 'arquivo': arquivo, 'dados': dados},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporario, cache)
+    except BaseException:
+        Path(temporario).unlink(missing_ok=True)
+        raise
+
+def _ler_fonte(nome, leitor, caminho, pasta_cache):
+    """
+    Executado no worker: lê uma fonte usando o cache quando válido.
+    Retorna (dados, origem, segundos, erro), onde origem é 'arquivo' ou 'cache'.
+    """
+    inicio = time.perf_counter()
+    caminho = Path(caminho)
+    nome_leitor, assinatura = _identificar_leitor(leitor)
+    if nome_leitor is None:
+        return leitor(caminho), 'arquivo', time.perf_counter() - inicio, None
+
+    cache = _caminho_cache(nome, pasta_cache)
+    arquivo = _identificar_arquivo(caminho)
+
+    dados = _ler_cache(cache, nome_leitor, arquivo, assinatura)
+    if dados is not None:
+        return dados, 'cache', time.perf_counter() - inicio, None
+
+    try:
+        dados = leitor(caminho)
+    except Exception as e:
+        dados = _ler_cache(cache, nome_leitor, arquivo)
+        if dados is None:
+            raise
+        return dados, 'cache', time.perf_counter() - inicio, e
+
+    _gravar_cache(cache, nome_leitor, assinatura, arquivo, dados)
+    return dados, 'arquivo', time.perf_counter() - inicio, None
+
+def limpar_cache():
+    """Remove as cópias pré-processadas, forçando a releitura dos originais"""
+    for padrao in ('*.pkl', '*.tmp'):
+        for arquivo in Path(CONFIG['PASTA_CACHE']).glob(padrao):
+            arquivo.unlink()
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PACOTE DE DADOS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@dataclass
+class TempoFonte:
+    """Tempo de leitura de uma fonte e de onde ela veio"""
+    fonte: str
+    segundos: float
+    origem: str
+    erro: str = ''
+
+@dataclass
+class PacoteDados:
+    """
+    Fontes brutas lidas por `carregar_fontes()`. Fontes não pedidas ficam
+    como None; fontes extras (fora de FONTES_PACOTE e dos formulários) ficam
+    em `outras`, pelo nome usado em `fontes`.
+    """
+    pib: pd.DataFrame = None
+    populacao_censo: pd.DataFrame = None
+    populacao_estimada: pd.DataFrame = None
+    atricon: pd.DataFrame = None
+    formularios: dict = field(default_factory=dict)  # nome do arquivo -> {aba: DataFrame}
+    outras: dict = field(default_factory=dict)       # nome da fonte -> dados
+    tempos: list = field(default_factory=list)       # list[TempoFonte]
+    segundos_total: float = 0.0
+
+    def relatorio_tempos(self):
+        """Tempos por fonte como DataFrame, do mais lento ao mais rápido"""
+        df = pd.DataFrame([vars(t) for t in self.tempos])
+        return df.sort_values('segundos', ascending=False, ignore_index=True)
+
+    def serie_historica(self):
+        """Monta a `SerieHistorica` a partir das fontes já carregadas"""
+        faltando = [nome for nome in FONTES_PACOTE if getattr(self, nome) is None]
+        if faltando:
+            raise ValueError(f"Fontes não carregadas para a série histórica: {', '.join(faltando)}")
+        return sh.SerieHistorica.de_fontes(sh.registros_pib(self.pib),
+                                           sh.registros_populacao_censo(self.populacao_censo),
+                                           sh.registros_populacao_estimada(self.populacao_estimada),
+                                           sh.registros_atricon(self.atricon))
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ORQUESTRADOR
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def carregar_fontes(fontes=None, executor=None, max_workers=None):
+    """
+    Lê todas as fontes em paralelo e devolve um `PacoteDados`.
+
+    `fontes` segue o formato de `fontes_padrao()` e pode conter só parte das
+    fontes ou fontes extras; `executor` é 'processo' ou 'thread' (padrão em
+    CONFIG). Falhas sem cópia em cache são propagadas.
+    """
+    fontes = fontes or fontes_padrao()
+    executor = executor or CONFIG['EXECUTOR']
+    max_workers = max_workers or CONFIG['MAX_WORKERS']
+    classe = ProcessPoolExecutor if executor == 'processo' else ThreadPoolExecutor
+
+    inicio = time.perf_counter()
+    with classe(max_workers=max_workers) as pool:
+        futuros = {nome: pool.submit(_ler_fonte, nome, leitor, caminho, CONFIG['PASTA_CACHE'])
+                   for nome, (leitor, caminho) in fontes.items()}
+        resultados = {nome: futuro.result() for nome, futuro in futuros.items()}
+
+    dados, formularios, outras, tempos = {}, {}, {}, []
+    for nome, (conteudo, origem, segundos, erro) in resultados.items():
+        tempos.append(TempoFonte(nome, segundos, origem, str(erro or '')))
+        if nome.startswith('formulario:'):
+            formularios[nome.split(':', 1)[1]] = conteudo
+        elif nome in FONTES_PACOTE:
+            dados[nome] = conteudo
+        else:
+            outras[nome] = conteudo
+
+    return PacoteDados(formularios=formularios, outras=outras, tempos=tempos,
+                       segundos_total=time.perf_counter() - inicio, **dados)
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FUNÇÃO PRINCIPAL
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main():
+    """Carrega todas as fontes e mostra o tempo de cada uma"""
+
+    print("\n" + "="*80)
+    print("📊 Carregando fontes brutas em paralelo...")
+    print("="*80)
+
+    pacote = carregar_fontes()
+
+    print(pacote.relatorio_tempos().to_string(index=False))
+    for t in pacote.tempos:
+        if t.erro:
+            print(f"⚠️  {t.fonte}: leitura falhou, usando cache ({t.erro})")
+    print(f"\n✓ {len(pacote.tempos)} fontes carregadas em {pacote.segundos_total:.2f}s")
+
+if __name__ == "__main__":
+    main()
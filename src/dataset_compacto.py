@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+═══════════════════════════════════════════════════════════════════════════════
+DATASET COMPACTO - REPRESENTAÇÃO EM MEMÓRIA DOS DADOS MUNICIPAIS
+═══════════════════════════════════════════════════════════════════════════════
+
+Reduz o uso de memória dos DataFrames municipais (df_analise, dados do
+carregar_dados(), avaliações ATRICON nacionais):
+
+  • textos repetidos (mesorregião, UF, nível ATRICON...) viram categóricos,
+    guardando cada valor distinto uma única vez;
+  • colunas numéricas são reduzidas ao menor tipo que representa os valores
+    (int64 -> int32/int16; float64 -> float32 só quando todos os valores são
+    representados exatamente, ou nas colunas pedidas explicitamente);
+  • recortes filtrados guardam só as posições das linhas selecionadas, sem
+    copiar o DataFrame inteiro a cada filtro.
+
+Autor: Pesquisa Framework LLM-Ready
+Data: Novembro 2025
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import pandas as pd
+import numpy as np
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONFIGURAÇÕES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+CONFIG = {
+    'MAX_PROPORCAO_UNICOS': 0.5,  # Textos com até 50% de valores distintos viram categóricos
+}
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONVERSÃO DE TIPOS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _reduzir_numerico(serie, forcar_float32=False):
+    """
+    Menor tipo numérico que representa a série sem alterar nenhum valor.
+    Com `forcar_float32=True` floats são reduzidos a float32 mesmo com perda
+    de precisão (~7 dígitos significativos).
+    """
+    if pd.api.types.is_bool_dtype(serie):
+        return serie
+
+    if pd.api.types.is_integer_dtype(serie):
+        return pd.to_numeric(serie, downcast='integer')
+
+    valores = serie.to_numpy(dtype=np.float64)
+    # Floats sem casas decimais e sem NaN/inf voltam a ser inteiros; colunas com
+    # NaN continuam float, pois int não representa valor ausente. Valores fora
+    # da faixa do int64 também continuam float (a conversão daria a volta)
+    if np.isfinite(valores).all() and np.array_equal(valores, np.round(valores)) \
+            and (len(valores) == 0 or np.abs(valores).max() < 2**63):
+        inteiros = valores.astype(np.int64)
+        if np.array_equal(inteiros.astype(np.float64), valores):
+            return pd.to_numeric(pd.Series(inteiros, index=serie.index, name=serie.name),
+                                 downcast='integer')
+
+    reduzida = serie.astype(np.float32)
+    if forcar_float32 or np.array_equal(reduzida.to_numpy(np.float64), valores, equal_nan=True):
+        return reduzida
+    return serie
+
+def compactar(df, max_proporcao_unicos=None, colunas_float32=()):
+    """
+    Retorna uma cópia de `df` com tipos compactos: textos repetidos como
+    categóricos e numéricos reduzidos sem alterar valores. Colunas de texto
+    quase únicas (nomes de municípios, links) são mantidas como estão.
+
+    As colunas em `colunas_float32` são reduzidas a float32 mesmo com perda de
+    precisão; use apenas para índices/percentuais, nunca para PIB ou população.
+    """
+    if max_proporcao_unicos is None:
+        max_proporcao_unicos = CONFIG['MAX_PROPORCAO_UNICOS']
+
+    colunas = {}
+    for coluna, serie in df.items():
+        if pd.api.types.is_numeric_dtype(serie):
+            colunas[coluna] = _reduzir_numerico(serie, coluna in colunas_float32)
+        elif pd.api.types.is_string_dtype(serie) and len(serie) > 0 \
+                and serie.nunique(dropna=True) / len(serie) <= max_proporcao_unicos:
+            colunas[coluna] = serie.astype('category')
+        else:
+            colunas[coluna] = serie
+    return pd.DataFrame(colunas, index=df.index)
+
+def separar_categorias(serie, separador=' / ', parte=0):
+    """
+    Equivalente a `serie.str.split(separador).str[parte]`, aplicado apenas aos
+    valores distintos quando a série é categórica (ex.: extrair a mesorregião
+    de 'Mesorregião / Microrregião').
+    """
+    if not isinstance(serie.dtype, pd.CategoricalDtype):
+        return serie.str.split(separador).str[parte].astype('category')
+    partes = serie.cat.categories.str.split(separador).str[parte]
+    # Categorias sem a parte pedida resultam em NaN, como em str.split
+    categorias = pd.Index(partes.dropna().unique())
+    codigos = categorias.get_indexer(partes)
+    # Reaproveita os códigos da série original: nenhum texto é recriado por linha
+    originais = serie.cat.codes.to_numpy()
+    novos = np.where(originais >= 0, codigos[originais], -1)
+    return pd.Series(pd.Categorical.from_codes(novos, categories=categorias),
+                     index=serie.index, name=serie.name)
+
+def relatorio_memoria(df, original=None):
+    """
+    Bytes ocupados por coluna (incluindo o conteúdo dos textos). Se `original`
+    for informado, inclui os bytes da versão original e a redução percentual.
+    """
+    relatorio = pd.DataFrame({
+        'dtype': df.dtypes.astype(str),
+        'bytes': df.memory_usage(index=False, deep=True),
+    })
+    if original is not None:
+        relatorio['bytes_original'] = original.memory_usage(index=False, deep=True)
+        relatorio['reducao_%'] = (1 - relatorio['bytes'] / relatorio['bytes_original']) * 100
+    relatorio.loc['TOTAL'] = relatorio.sum(numeric_only=True)
+    relatorio.loc['TOTAL', 'dtype'] = ''
+    if original is not None:
+        total = relatorio.loc['TOTAL']
+        relatorio.loc['TOTAL', 'reducao_%'] = (1 - total['bytes'] / total['bytes_original']) * 100
+    return relatorio
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# DATASET COM RECORTES SEM CÓPIA
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class DatasetCompacto:
+    """
+    DataFrame compactado com recortes leves.
+
+    `filtrar()` devolve outro DatasetCompacto que compartilha o mesmo DataFrame
+    base e guarda apenas as posições das linhas selecionadas (int32). As colunas
+    só são materializadas quando acessadas (`ds['coluna']`) ou em `para_pandas()`,
+    substituindo os `.copy()` encadeados (df_atricon_ro, df_atricon_ro_exec...).
+    """
+
+    def __init__(self, df, compactado=False, _linhas=None):
+        self.base = df if compactado else compactar(df)
+        self.linhas = _linhas
+
+    @classmethod
+    def de_csv(cls, caminho, **kwargs):
+        """Lê um CSV e compacta em seguida"""
+        return cls(pd.read_csv(caminho, **kwargs))
+
+    def __len__(self):
+        return len(self.base) if self.linhas is None else len(self.linhas)
+
+    def __repr__(self):
+        return (f"DatasetCompacto({len(self)} linhas de {len(self.base)}, "
+                f"{len(self.base.columns)} colunas)")
+
+    @property
+    def columns(self):
+        return self.base.columns
+
+    def __getitem__(self, coluna):
+        serie = self.base[coluna]
+        return serie if self.linhas is None else serie.take(self.linhas)
+
+    def filtrar(self, mascara):
+        """
+        Recorte pelas linhas em que `mascara` é verdadeira. A máscara pode ser
+        uma Series/array booleano do tamanho do recorte atual ou uma função que
+        recebe o próprio dataset, ex.: `ds.filtrar(lambda d: d['uf'] == 'RO')`.
+        """
+        if callable(mascara):
+            mascara = mascara(self)
+        posicoes = np.flatnonzero(np.asarray(mascara, dtype=bool))
+        if self.linhas is not None:
+            posicoes = self.linhas[posicoes]
+        return DatasetCompacto(self.base, compactado=True, _linhas=posicoes.astype(np.int32))
+
+    def para_pandas(self, colunas=None):
+        """Materializa o recorte como DataFrame (somente as colunas pedidas)"""
+        df = self.base if colunas is None else self.base[colunas]
+        return df if self.linhas is None else df.take(self.linhas)
+
+    def relatorio_memoria(self, original=None):
+        """Bytes por coluna do DataFrame base (ver `relatorio_memoria`)"""
+        return relatorio_memoria(self.base, original)
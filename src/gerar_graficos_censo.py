@@ -19,6 +19,8 @@ import seaborn as sns
 import numpy as np
 from pathlib import Path
 import warnings
+
+from dataset_compacto import compactar, separar_categorias
 warnings.filterwarnings('ignore')
 
 # Configurar estilo dos gráficos
@@ -43,6 +45,251 @@ CONFIG = {
     'FORMATO': 'png',  # Formato: png, jpg, pdf, svg
 }
 
+COLUNA_POPULACAO = 'População (IBGE/2024)'
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PAINÉIS REUTILIZÁVEIS
+# ═══════════════════════════════════════════════════════════════════════════════
+# Cada painel desenha em um Axes recebido, de modo que os gráficos individuais
+# e o dashboard usam o mesmo código e os mesmos dados preparados. Com
+# `detalhado=False` o painel usa a versão resumida do dashboard.
+
+def preparar_dados_graficos(df):
+    """
+    Calcula uma única vez os recortes e estatísticas compartilhados pelos
+    gráficos individuais e pelo dashboard
+    """
+    populacao = df[COLUNA_POPULACAO]
+    return {
+        'df': df,
+        'populacao': populacao,
+        'media': populacao.mean(),
+        'mediana': populacao.median(),
+        'std': populacao.std(),
+        'crescente': df.sort_values(COLUNA_POPULACAO, ascending=True, kind='stable'),
+        'decrescente': df.sort_values(COLUNA_POPULACAO, ascending=False, kind='stable'),
+        'contagem_mesorregiao': df['Mesorregiao'].value_counts(),
+        'pop_mesorregiao': df.groupby('Mesorregiao', observed=True)[COLUNA_POPULACAO]
+                             .agg(['sum', 'mean', 'count']),
+    }
+
+def painel_barras_populacao(ax, recorte, cmap, titulo, deslocamento=None, detalhado=True):
+    """Barras horizontais de população (maiores/menores municípios)"""
+    cores = cmap(np.linspace(0.4, 0.9, len(recorte)))
+    
+    if detalhado:
+        barras = ax.barh(recorte['Município'], recorte[COLUNA_POPULACAO],
+                         color=cores, edgecolor='black', linewidth=0.5)
+        ax.set_xlabel('População (habitantes)', fontweight='bold', fontsize=12)
+        ax.set_title(titulo, fontweight='bold', fontsize=13)
+        ax.grid(axis='x', alpha=0.3, linestyle='--')
+    else:
+        barras = ax.barh(recorte['Município'], recorte[COLUNA_POPULACAO], color=cores)
+        ax.set_title(titulo, fontweight='bold', fontsize=12)
+        ax.set_xlabel('População')
+        ax.grid(axis='x', alpha=0.3)
+    
+    # Adicionar valores nas barras
+    if deslocamento is not None:
+        for bar, pop in zip(barras, recorte[COLUNA_POPULACAO]):
+            ax.text(pop + deslocamento, bar.get_y() + bar.get_height()/2, 
+                    f'{pop:,.0f}', va='center', fontsize=9, fontweight='bold')
+
+def painel_pizza_mesorregiao(ax, dados, detalhado=True):
+    """Pizza com a proporção de municípios por mesorregião"""
+    contagem = dados['contagem_mesorregiao']
+    cores = ['#FF9999', '#66B3FF']
+    
+    if not detalhado:
+        ax.pie(contagem.values, labels=contagem.index, autopct='%1.1f%%',
+               colors=cores, startangle=90)
+        ax.set_title('Distribuição por Mesorregião', fontweight='bold', fontsize=12)
+        return
+    
+    wedges, texts, autotexts = ax.pie(contagem.values, 
+                                      labels=contagem.index,
+                                      autopct='%1.1f%%',
+                                      colors=cores,
+                                      explode=[0.05] * len(contagem),
+                                      startangle=90,
+                                      shadow=True,
+                                      textprops={'fontsize': 12, 'fontweight': 'bold'})
+    
+    # Melhorar visualização dos textos
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontsize(14)
+    
+    ax.set_title('Proporção de Municípios por Mesorregião', 
+                 fontweight='bold', fontsize=13, pad=20)
+
+def painel_barras_mesorregiao(ax, dados):
+    """Nº de municípios e população total por mesorregião (eixo duplo)"""
+    pop_mesorregiao = dados['pop_mesorregiao']
+    
+    x = np.arange(len(pop_mesorregiao))
+    width = 0.35
+    
+    bars1 = ax.bar(x - width/2, pop_mesorregiao['count'], width, 
+                   label='Nº de Municípios', color='#66B3FF', edgecolor='black')
+    
+    ax_twin = ax.twinx()
+    ax_twin.bar(x + width/2, pop_mesorregiao['sum']/1000, width,
+                label='População Total (milhares)', color='#FF9999', 
+                edgecolor='black', alpha=0.7)
+    
+    ax.set_xlabel('Mesorregião', fontweight='bold', fontsize=12)
+    ax.set_ylabel('Número de Municípios', fontweight='bold', fontsize=12)
+    ax_twin.set_ylabel('População Total (milhares)', fontweight='bold', fontsize=12)
+    ax.set_title('Municípios e População por Mesorregião', 
+                 fontweight='bold', fontsize=13)
+    ax.set_xticks(x)
+    ax.set_xticklabels(pop_mesorregiao.index, fontsize=11)
+    ax.grid(axis='y', alpha=0.3, linestyle='--')
+    
+    # Adicionar valores
+    for bar in bars1:
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height,
+                f'{int(height)}',
+                ha='center', va='bottom', fontweight='bold')
+    
+    # Legendas
+    lines1, labels1 = ax.get_legend_handles_labels()
+    lines2, labels2 = ax_twin.get_legend_handles_labels()
+    ax.legend(lines1 + lines2, labels1 + labels2, loc='upper right')
+
+def painel_histograma(ax, dados, bins=20, detalhado=True):
+    """Histograma populacional com média e mediana"""
+    populacao, media, mediana = dados['populacao'], dados['media'], dados['mediana']
+    
+    if not detalhado:
+        ax.hist(populacao, bins=bins, color='lightgreen', edgecolor='black', alpha=0.7)
+        ax.axvline(media, color='blue', linestyle='--', linewidth=2, label='Média')
+        ax.axvline(mediana, color='red', linestyle='--', linewidth=2, label='Mediana')
+        ax.set_title('Distribuição Populacional', fontweight='bold', fontsize=12)
+        ax.set_xlabel('População')
+        ax.set_ylabel('Frequência')
+        ax.legend()
+        ax.grid(alpha=0.3)
+        return
+    
+    n, bins, patches = ax.hist(populacao, 
+                               bins=bins, 
+                               color='lightgreen', 
+                               edgecolor='black',
+                               alpha=0.7,
+                               linewidth=1.5)
+    
+    # Colorir barras por gradiente
+    cm = plt.cm.RdYlGn
+    bin_centers = 0.5 * (bins[:-1] + bins[1:])
+    col = bin_centers - min(bin_centers)
+    col /= max(col)
+    
+    for c, p in zip(col, patches):
+        plt.setp(p, 'facecolor', cm(c))
+    
+    # Adicionar linhas de referência
+    ax.axvline(media, color='blue', linestyle='--', linewidth=2.5,
+               label=f'Média: {media:,.0f} hab', alpha=0.8)
+    ax.axvline(mediana, color='red', linestyle='--', linewidth=2.5,
+               label=f'Mediana: {mediana:,.0f} hab', alpha=0.8)
+    
+    # Adicionar área sombreada para 1 desvio padrão
+    std = dados['std']
+    ax.axvspan(media - std, media + std, alpha=0.2, color='yellow',
+               label=f'± 1 Desvio Padrão')
+    
+    ax.set_xlabel('População (habitantes)', fontweight='bold', fontsize=13)
+    ax.set_ylabel('Frequência (nº de municípios)', fontweight='bold', fontsize=13)
+    ax.set_title('Distribuição de Frequências', fontweight='bold', fontsize=14, pad=20)
+    ax.legend(fontsize=12, loc='upper right')
+    ax.grid(alpha=0.3, linestyle='--')
+    
+    # Adicionar texto com estatísticas
+    texto_stats = f"""
+    ESTATÍSTICAS DESCRITIVAS:
+    • Total: {len(populacao)} municípios
+    • Média: {media:,.0f} habitantes
+    • Mediana: {mediana:,.0f} habitantes
+    • Desvio Padrão: {std:,.0f}
+    • Mín: {populacao.min():,.0f}
+    • Máx: {populacao.max():,.0f}
+    """
+    
+    ax.text(0.98, 0.97, texto_stats,
+            transform=ax.transAxes,
+            fontsize=10,
+            verticalalignment='top',
+            horizontalalignment='right',
+            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+
+def painel_ranking(ax, recorte, cores, titulo, fontsize=8, mostrar_valores=True, detalhado=True):
+    """Ranking em barras horizontais com a posição no rótulo de cada município"""
+    posicoes = range(len(recorte))
+    bars = ax.barh(posicoes, recorte[COLUNA_POPULACAO], color=cores,
+                   **({'edgecolor': 'black', 'linewidth': 0.5} if detalhado else {}))
+    
+    # Configurar eixos
+    ax.set_yticks(posicoes)
+    ax.set_yticklabels([f"{i+1}. {mun}" for i, mun in enumerate(recorte['Município'])],
+                       fontsize=fontsize)
+    if detalhado:
+        ax.set_xlabel('População (habitantes)', fontweight='bold', fontsize=12)
+        ax.set_title(titulo, fontweight='bold', fontsize=13, pad=20)
+        ax.grid(axis='x', alpha=0.3, linestyle='--')
+    else:
+        ax.set_title(titulo, fontweight='bold', fontsize=12)
+        ax.set_xlabel('População')
+        ax.grid(axis='x', alpha=0.3)
+    
+    # Adicionar valores
+    if mostrar_valores:
+        for bar, pop in zip(bars, recorte[COLUNA_POPULACAO]):
+            ax.text(pop + 2000, bar.get_y() + bar.get_height()/2, 
+                    f'{pop:,.0f}', va='center', fontsize=7)
+
+def painel_estatisticas(ax, dados):
+    """Quadro de texto com as estatísticas gerais do dashboard"""
+    df, populacao = dados['df'], dados['populacao']
+    ax.axis('off')
+    
+    stats_text = f"""
+    📊 ESTATÍSTICAS GERAIS
+    
+    Total de Municípios: {len(df)}
+    
+    População Total: {populacao.sum():,.0f}
+    
+    População Média: {dados['media']:,.0f}
+    
+    População Mediana: {dados['mediana']:,.0f}
+    
+    Desvio Padrão: {dados['std']:,.0f}
+    
+    Maior Município:
+    {df.loc[populacao.idxmax(), 'Município']}
+    ({populacao.max():,.0f} hab)
+    
+    Menor Município:
+    {df.loc[populacao.idxmin(), 'Município']}
+    ({populacao.min():,.0f} hab)
+    """
+    
+    ax.text(0.1, 0.5, stats_text, fontsize=11, family='monospace',
+            verticalalignment='center',
+            bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
+
+def salvar_figura(fig, pasta_saida, nome):
+    """Ajusta o layout, salva a figura com a configuração padrão e a fecha"""
+    fig.tight_layout()
+    arquivo = pasta_saida / f'{nome}.{CONFIG["FORMATO"]}'
+    fig.savefig(arquivo, dpi=CONFIG['DPI'], bbox_inches='tight')
+    plt.close(fig)
+    
+    print(f"✓ Salvo: {arquivo}")
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # FUNÇÕES DE VISUALIZAÇÃO
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -60,13 +307,13 @@ def carregar_dados():
     print("="*80)
     
     try:
-        df = pd.read_excel(CONFIG['ARQUIVO_ENTRADA'], sheet_name='Fase1_Atributos')
+        df = compactar(pd.read_excel(CONFIG['ARQUIVO_ENTRADA'], sheet_name='Fase1_Atributos'))
         
-        # Extrair mesorregião
-        df['Mesorregiao'] = df['Mesorregião / Microrregião'].str.split(' / ').str[0]
+        # Extrair mesorregião (dividindo só as categorias distintas)
+        df['Mesorregiao'] = separar_categorias(df['Mesorregião / Microrregião'], ' / ')
         
         print(f"✓ Dados carregados: {len(df)} municípios")
-        print(f"✓ População total: {df['População (IBGE/2024)'].sum():,} habitantes")
+        print(f"✓ População total: {df[COLUNA_POPULACAO].sum():,} habitantes")
         
         return df
         
@@ -78,11 +325,12 @@ def carregar_dados():
         print(f"\n❌ ERRO ao carregar dados: {e}")
         return None
 
-def grafico_1_distribuicao_populacional(df, pasta_saida):
+def grafico_1_distribuicao_populacional(df, pasta_saida, dados=None):
     """
     Gráfico 1: Distribuição populacional com maiores e menores municípios
     """
     print("\n📊 Gerando Gráfico 1: Distribuição populacional...")
+    dados = dados or preparar_dados_graficos(df)
     
     fig, axes = plt.subplots(1, 2, figsize=(18, 8))
     fig.suptitle('DISTRIBUIÇÃO POPULACIONAL DOS MUNICÍPIOS DE RONDÔNIA\n' + 
@@ -90,199 +338,50 @@ def grafico_1_distribuicao_populacional(df, pasta_saida):
                  fontsize=16, fontweight='bold', y=0.98)
     
     # Gráfico 1A: 10 Maiores municípios
-    ax1 = axes[0]
-    df_maiores = df.nlargest(10, 'População (IBGE/2024)')
-    cores_maiores = plt.cm.Blues(np.linspace(0.4, 0.9, 10))
-    
-    bars1 = ax1.barh(df_maiores['Município'], df_maiores['População (IBGE/2024)'], 
-                     color=cores_maiores, edgecolor='black', linewidth=0.5)
-    
-    ax1.set_xlabel('População (habitantes)', fontweight='bold', fontsize=12)
-    ax1.set_title('10 MAIORES Municípios por População', fontweight='bold', fontsize=13)
-    ax1.grid(axis='x', alpha=0.3, linestyle='--')
-    
-    # Adicionar valores nas barras
-    for i, (bar, pop) in enumerate(zip(bars1, df_maiores['População (IBGE/2024)'])):
-        ax1.text(pop + 5000, bar.get_y() + bar.get_height()/2, 
-                f'{pop:,.0f}', va='center', fontsize=9, fontweight='bold')
+    painel_barras_populacao(axes[0], dados['decrescente'].head(10), plt.cm.Blues,
+                            '10 MAIORES Municípios por População', deslocamento=5000)
     
     # Gráfico 1B: 10 Menores municípios
-    ax2 = axes[1]
-    df_menores = df.nsmallest(10, 'População (IBGE/2024)')
-    cores_menores = plt.cm.Oranges(np.linspace(0.4, 0.9, 10))
-    
-    bars2 = ax2.barh(df_menores['Município'], df_menores['População (IBGE/2024)'], 
-                     color=cores_menores, edgecolor='black', linewidth=0.5)
-    
-    ax2.set_xlabel('População (habitantes)', fontweight='bold', fontsize=12)
-    ax2.set_title('10 MENORES Municípios por População', fontweight='bold', fontsize=13)
-    ax2.grid(axis='x', alpha=0.3, linestyle='--')
+    painel_barras_populacao(axes[1], dados['crescente'].head(10), plt.cm.Oranges,
+                            '10 MENORES Municípios por População', deslocamento=100)
     
-    # Adicionar valores nas barras
-    for bar, pop in zip(bars2, df_menores['População (IBGE/2024)']):
-        ax2.text(pop + 100, bar.get_y() + bar.get_height()/2, 
-                f'{pop:,.0f}', va='center', fontsize=9, fontweight='bold')
-    
-    plt.tight_layout()
-    arquivo = pasta_saida / f'01_distribuicao_populacional.{CONFIG["FORMATO"]}'
-    plt.savefig(arquivo, dpi=CONFIG['DPI'], bbox_inches='tight')
-    plt.close()
-    
-    print(f"✓ Salvo: {arquivo}")
+    salvar_figura(fig, pasta_saida, '01_distribuicao_populacional')
 
-def grafico_2_distribuicao_mesorregiao(df, pasta_saida):
+def grafico_2_distribuicao_mesorregiao(df, pasta_saida, dados=None):
     """
     Gráfico 2: Distribuição por mesorregião (pizza + barras)
     """
     print("\n📊 Gerando Gráfico 2: Distribuição por mesorregião...")
+    dados = dados or preparar_dados_graficos(df)
     
     fig, axes = plt.subplots(1, 2, figsize=(18, 8))
     fig.suptitle('DISTRIBUIÇÃO DOS MUNICÍPIOS POR MESORREGIÃO\n' + 
                  'Estado de Rondônia - 52 Municípios',
                  fontsize=16, fontweight='bold', y=0.98)
     
-    # Contar municípios por mesorregião
-    contagem = df['Mesorregiao'].value_counts()
-    
     # Gráfico 2A: Pizza
-    ax1 = axes[0]
-    cores = ['#FF9999', '#66B3FF']
-    explode = (0.05, 0.05)
-    
-    wedges, texts, autotexts = ax1.pie(contagem.values, 
-                                        labels=contagem.index,
-                                        autopct='%1.1f%%',
-                                        colors=cores,
-                                        explode=explode,
-                                        startangle=90,
-                                        shadow=True,
-                                        textprops={'fontsize': 12, 'fontweight': 'bold'})
-    
-    # Melhorar visualização dos textos
-    for autotext in autotexts:
-        autotext.set_color('white')
-        autotext.set_fontsize(14)
-    
-    ax1.set_title('Proporção de Municípios por Mesorregião', 
-                 fontweight='bold', fontsize=13, pad=20)
+    painel_pizza_mesorregiao(axes[0], dados)
     
     # Gráfico 2B: Barras com detalhes
-    ax2 = axes[1]
-    
-    # Calcular população por mesorregião
-    pop_mesorregiao = df.groupby('Mesorregiao')['População (IBGE/2024)'].agg(['sum', 'mean', 'count'])
-    
-    x = np.arange(len(pop_mesorregiao))
-    width = 0.35
-    
-    bars1 = ax2.bar(x - width/2, pop_mesorregiao['count'], width, 
-                    label='Nº de Municípios', color='#66B3FF', edgecolor='black')
-    
-    ax2_twin = ax2.twinx()
-    bars2 = ax2_twin.bar(x + width/2, pop_mesorregiao['sum']/1000, width,
-                         label='População Total (milhares)', color='#FF9999', 
-                         edgecolor='black', alpha=0.7)
-    
-    ax2.set_xlabel('Mesorregião', fontweight='bold', fontsize=12)
-    ax2.set_ylabel('Número de Municípios', fontweight='bold', fontsize=12)
-    ax2_twin.set_ylabel('População Total (milhares)', fontweight='bold', fontsize=12)
-    ax2.set_title('Municípios e População por Mesorregião', 
-                 fontweight='bold', fontsize=13)
-    ax2.set_xticks(x)
-    ax2.set_xticklabels(pop_mesorregiao.index, fontsize=11)
-    ax2.grid(axis='y', alpha=0.3, linestyle='--')
+    painel_barras_mesorregiao(axes[1], dados)
     
-    # Adicionar valores
-    for bar in bars1:
-        height = bar.get_height()
-        ax2.text(bar.get_x() + bar.get_width()/2., height,
-                f'{int(height)}',
-                ha='center', va='bottom', fontweight='bold')
-    
-    # Legendas
-    lines1, labels1 = ax2.get_legend_handles_labels()
-    lines2, labels2 = ax2_twin.get_legend_handles_labels()
-    ax2.legend(lines1 + lines2, labels1 + labels2, loc='upper right')
-    
-    plt.tight_layout()
-    arquivo = pasta_saida / f'02_distribuicao_mesorregiao.{CONFIG["FORMATO"]}'
-    plt.savefig(arquivo, dpi=CONFIG['DPI'], bbox_inches='tight')
-    plt.close()
-    
-    print(f"✓ Salvo: {arquivo}")
+    salvar_figura(fig, pasta_saida, '02_distribuicao_mesorregiao')
 
-def grafico_3_histograma_populacional(df, pasta_saida):
+def grafico_3_histograma_populacional(df, pasta_saida, dados=None):
     """
     Gráfico 3: Histograma da distribuição populacional
     """
     print("\n📊 Gerando Gráfico 3: Histograma populacional...")
+    dados = dados or preparar_dados_graficos(df)
     
     fig, ax = plt.subplots(figsize=(14, 8))
     fig.suptitle('DISTRIBUIÇÃO POPULACIONAL DOS 52 MUNICÍPIOS\n' + 
                  'Histograma com Medidas de Tendência Central',
                  fontsize=16, fontweight='bold')
     
-    # Criar histograma
-    n, bins, patches = ax.hist(df['População (IBGE/2024)'], 
-                               bins=20, 
-                               color='lightgreen', 
-                               edgecolor='black',
-                               alpha=0.7,
-                               linewidth=1.5)
-    
-    # Colorir barras por gradiente
-    cm = plt.cm.RdYlGn
-    bin_centers = 0.5 * (bins[:-1] + bins[1:])
-    col = bin_centers - min(bin_centers)
-    col /= max(col)
+    painel_histograma(ax, dados, bins=20)
     
-    for c, p in zip(col, patches):
-        plt.setp(p, 'facecolor', cm(c))
-    
-    # Adicionar linhas de referência
-    media = df['População (IBGE/2024)'].mean()
-    mediana = df['População (IBGE/2024)'].median()
-    
-    ax.axvline(media, color='blue', linestyle='--', linewidth=2.5,
-              label=f'Média: {media:,.0f} hab', alpha=0.8)
-    ax.axvline(mediana, color='red', linestyle='--', linewidth=2.5,
-              label=f'Mediana: {mediana:,.0f} hab', alpha=0.8)
-    
-    # Adicionar área sombreada para 1 desvio padrão
-    std = df['População (IBGE/2024)'].std()
-    ax.axvspan(media - std, media + std, alpha=0.2, color='yellow',
-              label=f'± 1 Desvio Padrão')
-    
-    ax.set_xlabel('População (habitantes)', fontweight='bold', fontsize=13)
-    ax.set_ylabel('Frequência (nº de municípios)', fontweight='bold', fontsize=13)
-    ax.set_title('Distribuição de Frequências', fontweight='bold', fontsize=14, pad=20)
-    ax.legend(fontsize=12, loc='upper right')
-    ax.grid(alpha=0.3, linestyle='--')
-    
-    # Adicionar texto com estatísticas
-    texto_stats = f"""
-    ESTATÍSTICAS DESCRITIVAS:
-    • Total: {len(df)} municípios
-    • Média: {media:,.0f} habitantes
-    • Mediana: {mediana:,.0f} habitantes
-    • Desvio Padrão: {std:,.0f}
-    • Mín: {df['População (IBGE/2024)'].min():,.0f}
-    • Máx: {df['População (IBGE/2024)'].max():,.0f}
-    """
-    
-    ax.text(0.98, 0.97, texto_stats,
-           transform=ax.transAxes,
-           fontsize=10,
-           verticalalignment='top',
-           horizontalalignment='right',
-           bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
-    
-    plt.tight_layout()
-    arquivo = pasta_saida / f'03_histograma_populacional.{CONFIG["FORMATO"]}'
-    plt.savefig(arquivo, dpi=CONFIG['DPI'], bbox_inches='tight')
-    plt.close()
-    
-    print(f"✓ Salvo: {arquivo}")
+    salvar_figura(fig, pasta_saida, '03_histograma_populacional')
 
 def grafico_4_boxplot_comparativo(df, pasta_saida):
     """
@@ -297,8 +396,8 @@ def grafico_4_boxplot_comparativo(df, pasta_saida):
     
     # Gráfico 4A: Boxplot
     ax1 = axes[0]
-    bp = ax1.boxplot([df[df['Mesorregiao'] == 'Madeira-Guaporé']['População (IBGE/2024)'],
-                       df[df['Mesorregiao'] == 'Leste Rondoniense']['População (IBGE/2024)']],
+    bp = ax1.boxplot([df[df['Mesorregiao'] == 'Madeira-Guaporé'][COLUNA_POPULACAO],
+                       df[df['Mesorregiao'] == 'Leste Rondoniense'][COLUNA_POPULACAO]],
                       labels=['Madeira-Guaporé', 'Leste Rondoniense'],
                       patch_artist=True,
                       notch=True,
@@ -317,8 +416,8 @@ def grafico_4_boxplot_comparativo(df, pasta_saida):
     
     # Gráfico 4B: Violin plot
     ax2 = axes[1]
-    parts = ax2.violinplot([df[df['Mesorregiao'] == 'Madeira-Guaporé']['População (IBGE/2024)'],
-                            df[df['Mesorregiao'] == 'Leste Rondoniense']['População (IBGE/2024)']],
+    parts = ax2.violinplot([df[df['Mesorregiao'] == 'Madeira-Guaporé'][COLUNA_POPULACAO],
+                            df[df['Mesorregiao'] == 'Leste Rondoniense'][COLUNA_POPULACAO]],
                            positions=[1, 2],
                            showmeans=True,
                            showmedians=True)
@@ -335,55 +434,29 @@ def grafico_4_boxplot_comparativo(df, pasta_saida):
     ax2.grid(axis='y', alpha=0.3, linestyle='--')
     ax2.set_yscale('log')
     
-    plt.tight_layout()
-    arquivo = pasta_saida / f'04_boxplot_comparativo.{CONFIG["FORMATO"]}'
-    plt.savefig(arquivo, dpi=CONFIG['DPI'], bbox_inches='tight')
-    plt.close()
-    
-    print(f"✓ Salvo: {arquivo}")
+    salvar_figura(fig, pasta_saida, '04_boxplot_comparativo')
 
-def grafico_5_ranking_completo(df, pasta_saida):
+def grafico_5_ranking_completo(df, pasta_saida, dados=None):
     """
     Gráfico 5: Ranking completo de todos os 52 municípios
     """
     print("\n📊 Gerando Gráfico 5: Ranking completo...")
+    dados = dados or preparar_dados_graficos(df)
     
     fig, ax = plt.subplots(figsize=(12, 20))
     fig.suptitle('RANKING COMPLETO DOS 52 MUNICÍPIOS DE RONDÔNIA\n' + 
                  'Ordenados por População - IBGE 2024',
                  fontsize=16, fontweight='bold')
     
-    # Ordenar por população
-    df_sorted = df.sort_values('População (IBGE/2024)', ascending=True)
-    
     # Criar cores gradientes
-    norm = plt.Normalize(df_sorted['População (IBGE/2024)'].min(), 
-                        df_sorted['População (IBGE/2024)'].max())
-    cores = plt.cm.RdYlGn(norm(df_sorted['População (IBGE/2024)']))
+    df_sorted = dados['crescente']
+    norm = plt.Normalize(df_sorted[COLUNA_POPULACAO].min(), 
+                         df_sorted[COLUNA_POPULACAO].max())
+    cores = plt.cm.RdYlGn(norm(df_sorted[COLUNA_POPULACAO]))
     
-    # Criar barras
-    bars = ax.barh(range(len(df_sorted)), df_sorted['População (IBGE/2024)'],
-                   color=cores, edgecolor='black', linewidth=0.5)
+    painel_ranking(ax, df_sorted, cores, 'Ordem Crescente de População')
     
-    # Configurar eixos
-    ax.set_yticks(range(len(df_sorted)))
-    ax.set_yticklabels([f"{i+1}. {mun}" for i, mun in enumerate(df_sorted['Município'])],
-                       fontsize=8)
-    ax.set_xlabel('População (habitantes)', fontweight='bold', fontsize=12)
-    ax.set_title('Ordem Crescente de População', fontweight='bold', fontsize=13, pad=20)
-    ax.grid(axis='x', alpha=0.3, linestyle='--')
-    
-    # Adicionar valores
-    for i, (bar, pop) in enumerate(zip(bars, df_sorted['População (IBGE/2024)'])):
-        ax.text(pop + 2000, bar.get_y() + bar.get_height()/2, 
-                f'{pop:,.0f}', va='center', fontsize=7)
-    
-    plt.tight_layout()
-    arquivo = pasta_saida / f'05_ranking_completo.{CONFIG["FORMATO"]}'
-    plt.savefig(arquivo, dpi=CONFIG['DPI'], bbox_inches='tight')
-    plt.close()
-    
-    print(f"✓ Salvo: {arquivo}")
+    salvar_figura(fig, pasta_saida, '05_ranking_completo')
 
 def grafico_6_analise_estratificada(df, pasta_saida):
     """
@@ -402,7 +475,7 @@ def grafico_6_analise_estratificada(df, pasta_saida):
         else:
             return 'Muito Pequeno (<10k)'
     
-    df['Porte'] = df['População (IBGE/2024)'].apply(classificar_porte)
+    df['Porte'] = df[COLUNA_POPULACAO].apply(classificar_porte)
     
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
     fig.suptitle('ANÁLISE ESTRATIFICADA POR PORTE POPULACIONAL\n' + 
@@ -434,7 +507,7 @@ def grafico_6_analise_estratificada(df, pasta_saida):
     
     # Gráfico 6B: População por porte
     ax2 = axes[0, 1]
-    pop_porte = df.groupby('Porte')['População (IBGE/2024)'].sum().reindex(ordem)
+    pop_porte = df.groupby('Porte')[COLUNA_POPULACAO].sum().reindex(ordem)
     
     bars2 = ax2.bar(range(len(pop_porte)), pop_porte.values/1000,
                     color=cores_porte, edgecolor='black', linewidth=1.5)
@@ -449,7 +522,7 @@ def grafico_6_analise_estratificada(df, pasta_saida):
     for bar, pop in zip(bars2, pop_porte.values):
         height = bar.get_height()
         ax2.text(bar.get_x() + bar.get_width()/2., height,
-                f'{pop/1000:.0f}k\n({pop/df["População (IBGE/2024)"].sum()*100:.1f}%)',
+                f'{pop/1000:.0f}k\n({pop/df[COLUNA_POPULACAO].sum()*100:.1f}%)',
                 ha='center', va='bottom', fontweight='bold', fontsize=10)
     
     # Gráfico 6C: Pizza - proporção populacional
@@ -469,7 +542,7 @@ def grafico_6_analise_estratificada(df, pasta_saida):
     
     # Gráfico 6D: Média populacional por porte
     ax4 = axes[1, 1]
-    media_porte = df.groupby('Porte')['População (IBGE/2024)'].mean().reindex(ordem)
+    media_porte = df.groupby('Porte')[COLUNA_POPULACAO].mean().reindex(ordem)
     
     bars4 = ax4.bar(range(len(media_porte)), media_porte.values/1000,
                     color=cores_porte, edgecolor='black', linewidth=1.5)
@@ -487,18 +560,15 @@ def grafico_6_analise_estratificada(df, pasta_saida):
                 f'{pop/1000:.1f}k',
                 ha='center', va='bottom', fontweight='bold', fontsize=10)
     
-    plt.tight_layout()
-    arquivo = pasta_saida / f'06_analise_estratificada.{CONFIG["FORMATO"]}'
-    plt.savefig(arquivo, dpi=CONFIG['DPI'], bbox_inches='tight')
-    plt.close()
-    
-    print(f"✓ Salvo: {arquivo}")
+    salvar_figura(fig, pasta_saida, '06_analise_estratificada')
 
-def grafico_7_dashboard_completo(df, pasta_saida):
+def grafico_7_dashboard_completo(df, pasta_saida, dados=None):
     """
-    Gráfico 7: Dashboard resumo com principais indicadores
+    Gráfico 7: Dashboard resumo com principais indicadores, montado com os
+    mesmos painéis dos gráficos 1, 2, 3 e 5 (versão resumida)
     """
     print("\n📊 Gerando Gráfico 7: Dashboard completo...")
+    dados = dados or preparar_dados_graficos(df)
     
     fig = plt.figure(figsize=(20, 12))
     gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
@@ -508,83 +578,25 @@ def grafico_7_dashboard_completo(df, pasta_saida):
                  fontsize=18, fontweight='bold', y=0.98)
     
     # Painel 1: Estatísticas gerais (texto)
-    ax1 = fig.add_subplot(gs[0, 0])
-    ax1.axis('off')
-    
-    stats_text = f"""
-    📊 ESTATÍSTICAS GERAIS
-    
-    Total de Municípios: {len(df)}
-    
-    População Total: {df['População (IBGE/2024)'].sum():,.0f}
-    
-    População Média: {df['População (IBGE/2024)'].mean():,.0f}
-    
-    População Mediana: {df['População (IBGE/2024)'].median():,.0f}
-    
-    Desvio Padrão: {df['População (IBGE/2024)'].std():,.0f}
-    
-    Maior Município:
-    {df.loc[df['População (IBGE/2024)'].idxmax(), 'Município']}
-    ({df['População (IBGE/2024)'].max():,.0f} hab)
-    
-    Menor Município:
-    {df.loc[df['População (IBGE/2024)'].idxmin(), 'Município']}
-    ({df['População (IBGE/2024)'].min():,.0f} hab)
-    """
-    
-    ax1.text(0.1, 0.5, stats_text, fontsize=11, family='monospace',
-            verticalalignment='center',
-            bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
+    painel_estatisticas(fig.add_subplot(gs[0, 0]), dados)
     
     # Painel 2: Top 5 maiores
-    ax2 = fig.add_subplot(gs[0, 1:])
-    top5 = df.nlargest(5, 'População (IBGE/2024)')
-    ax2.barh(top5['Município'], top5['População (IBGE/2024)'],
-            color=plt.cm.Blues(np.linspace(0.4, 0.9, 5)))
-    ax2.set_title('Top 5 Maiores Municípios', fontweight='bold', fontsize=12)
-    ax2.set_xlabel('População')
-    ax2.grid(axis='x', alpha=0.3)
+    painel_barras_populacao(fig.add_subplot(gs[0, 1:]), dados['decrescente'].head(5),
+                            plt.cm.Blues, 'Top 5 Maiores Municípios', detalhado=False)
     
     # Painel 3: Distribuição por mesorregião
-    ax3 = fig.add_subplot(gs[1, 0])
-    contagem = df['Mesorregiao'].value_counts()
-    ax3.pie(contagem.values, labels=contagem.index, autopct='%1.1f%%',
-           colors=['#FF9999', '#66B3FF'], startangle=90)
-    ax3.set_title('Distribuição por Mesorregião', fontweight='bold', fontsize=12)
+    painel_pizza_mesorregiao(fig.add_subplot(gs[1, 0]), dados, detalhado=False)
     
     # Painel 4: Histograma
-    ax4 = fig.add_subplot(gs[1, 1:])
-    ax4.hist(df['População (IBGE/2024)'], bins=15, color='lightgreen',
-            edgecolor='black', alpha=0.7)
-    ax4.axvline(df['População (IBGE/2024)'].mean(), color='blue',
-               linestyle='--', linewidth=2, label='Média')
-    ax4.axvline(df['População (IBGE/2024)'].median(), color='red',
-               linestyle='--', linewidth=2, label='Mediana')
-    ax4.set_title('Distribuição Populacional', fontweight='bold', fontsize=12)
-    ax4.set_xlabel('População')
-    ax4.set_ylabel('Frequência')
-    ax4.legend()
-    ax4.grid(alpha=0.3)
+    painel_histograma(fig.add_subplot(gs[1, 1:]), dados, bins=15, detalhado=False)
     
     # Painel 5: Ranking top 15
-    ax5 = fig.add_subplot(gs[2, :])
-    top15 = df.nlargest(15, 'População (IBGE/2024)')
-    cores_ranking = plt.cm.viridis(np.linspace(0, 1, 15))
-    ax5.barh(range(15), top15['População (IBGE/2024)'], color=cores_ranking)
-    ax5.set_yticks(range(15))
-    ax5.set_yticklabels([f"{i+1}. {mun}" for i, mun in enumerate(top15['Município'])],
-                        fontsize=9)
-    ax5.set_title('Top 15 Municípios Mais Populosos', fontweight='bold', fontsize=12)
-    ax5.set_xlabel('População')
-    ax5.grid(axis='x', alpha=0.3)
-    
-    plt.tight_layout()
-    arquivo = pasta_saida / f'07_dashboard_completo.{CONFIG["FORMATO"]}'
-    plt.savefig(arquivo, dpi=CONFIG['DPI'], bbox_inches='tight')
-    plt.close()
+    top15 = dados['decrescente'].head(15)
+    painel_ranking(fig.add_subplot(gs[2, :]), top15, plt.cm.viridis(np.linspace(0, 1, 15)),
+                   'Top 15 Municípios Mais Populosos', fontsize=9,
+                   mostrar_valores=False, detalhado=False)
     
-    print(f"✓ Salvo: {arquivo}")
+    salvar_figura(fig, pasta_saida, '07_dashboard_completo')
 
 def gerar_relatorio_texto(df, pasta_saida):
     """
@@ -605,28 +617,28 @@ Fonte: IBGE 2024
 ═══════════════════════════════════════════════════════════════════════════════
 
 Total de Municípios: {len(df)}
-População Total: {df['População (IBGE/2024)'].sum():,.0f} habitantes
+População Total: {df[COLUNA_POPULACAO].sum():,.0f} habitantes
 
 Medidas de Tendência Central:
-  • Média: {df['População (IBGE/2024)'].mean():,.2f} habitantes
-  • Mediana: {df['População (IBGE/2024)'].median():,.0f} habitantes
-  • Moda: {df['População (IBGE/2024)'].mode()[0]:,.0f} habitantes
+  • Média: {df[COLUNA_POPULACAO].mean():,.2f} habitantes
+  • Mediana: {df[COLUNA_POPULACAO].median():,.0f} habitantes
+  • Moda: {df[COLUNA_POPULACAO].mode()[0]:,.0f} habitantes
 
 Medidas de Dispersão:
-  • Desvio Padrão: {df['População (IBGE/2024)'].std():,.2f}
-  • Variância: {df['População (IBGE/2024)'].var():,.2f}
-  • Coeficiente de Variação: {(df['População (IBGE/2024)'].std() / df['População (IBGE/2024)'].mean() * 100):.2f}%
+  • Desvio Padrão: {df[COLUNA_POPULACAO].std():,.2f}
+  • Variância: {df[COLUNA_POPULACAO].var():,.2f}
+  • Coeficiente de Variação: {(df[COLUNA_POPULACAO].std() / df[COLUNA_POPULACAO].mean() * 100):.2f}%
 
 Valores Extremos:
-  • Mínimo: {df['População (IBGE/2024)'].min():,.0f} habitantes
-  • Máximo: {df['População (IBGE/2024)'].max():,.0f} habitantes
-  • Amplitude: {df['População (IBGE/2024)'].max() - df['População (IBGE/2024)'].min():,.0f}
+  • Mínimo: {df[COLUNA_POPULACAO].min():,.0f} habitantes
+  • Máximo: {df[COLUNA_POPULACAO].max():,.0f} habitantes
+  • Amplitude: {df[COLUNA_POPULACAO].max() - df[COLUNA_POPULACAO].min():,.0f}
 
 Quartis:
-  • Q1 (25%): {df['População (IBGE/2024)'].quantile(0.25):,.0f}
-  • Q2 (50%): {df['População (IBGE/2024)'].quantile(0.50):,.0f}
-  • Q3 (75%): {df['População (IBGE/2024)'].quantile(0.75):,.0f}
-  • IQR: {df['População (IBGE/2024)'].quantile(0.75) - df['População (IBGE/2024)'].quantile(0.25):,.0f}
+  • Q1 (25%): {df[COLUNA_POPULACAO].quantile(0.25):,.0f}
+  • Q2 (50%): {df[COLUNA_POPULACAO].quantile(0.50):,.0f}
+  • Q3 (75%): {df[COLUNA_POPULACAO].quantile(0.75):,.0f}
+  • IQR: {df[COLUNA_POPULACAO].quantile(0.75) - df[COLUNA_POPULACAO].quantile(0.25):,.0f}
 
 ═══════════════════════════════════════════════════════════════════════════════
 2. DISTRIBUIÇÃO POR MESORREGIÃO
@@ -634,7 +646,7 @@ Quartis:
 
 {df.groupby('Mesorregiao').agg({
     'Município': 'count',
-    'População (IBGE/2024)': ['sum', 'mean', 'min', 'max']
+    COLUNA_POPULACAO: ['sum', 'mean', 'min', 'max']
 }).to_string()}
 
 ═══════════════════════════════════════════════════════════════════════════════
@@ -654,11 +666,11 @@ Quartis:
         else:
             return 'Muito Pequeno (<10k)'
     
-    df['Porte'] = df['População (IBGE/2024)'].apply(classificar_porte)
+    df['Porte'] = df[COLUNA_POPULACAO].apply(classificar_porte)
     
     relatorio += df.groupby('Porte').agg({
         'Município': 'count',
-        'População (IBGE/2024)': ['sum', 'mean']
+        COLUNA_POPULACAO: ['sum', 'mean']
     }).to_string()
     
     relatorio += f"""
@@ -667,13 +679,13 @@ Quartis:
 4. TOP 10 MAIORES MUNICÍPIOS
 ═══════════════════════════════════════════════════════════════════════════════
 
-{df.nlargest(10, 'População (IBGE/2024)')[['Município', 'População (IBGE/2024)', 'Mesorregiao']].to_string(index=False)}
+{df.nlargest(10, COLUNA_POPULACAO)[['Município', COLUNA_POPULACAO, 'Mesorregiao']].to_string(index=False)}
 
 ═══════════════════════════════════════════════════════════════════════════════
 5. TOP 10 MENORES MUNICÍPIOS
 ═══════════════════════════════════════════════════════════════════════════════
 
-{df.nsmallest(10, 'População (IBGE/2024)')[['Município', 'População (IBGE/2024)', 'Mesorregiao']].to_string(index=False)}
+{df.nsmallest(10, COLUNA_POPULACAO)[['Município', COLUNA_POPULACAO, 'Mesorregiao']].to_string(index=False)}
 
 ═══════════════════════════════════════════════════════════════════════════════
 FIM DO RELATÓRIO
@@ -712,14 +724,17 @@ def main():
     print("="*80)
     
     try:
+        # Recortes e estatísticas compartilhados pelos gráficos e pelo dashboard
+        dados = preparar_dados_graficos(df)
+        
         # Gerar cada gráfico
-        grafico_1_distribuicao_populacional(df, pasta_saida)
-        grafico_2_distribuicao_mesorregiao(df, pasta_saida)
-        grafico_3_histograma_populacional(df, pasta_saida)
+        grafico_1_distribuicao_populacional(df, pasta_saida, dados)
+        grafico_2_distribuicao_mesorregiao(df, pasta_saida, dados)
+        grafico_3_histograma_populacional(df, pasta_saida, dados)
         grafico_4_boxplot_comparativo(df, pasta_saida)
-        grafico_5_ranking_completo(df, pasta_saida)
+        grafico_5_ranking_completo(df, pasta_saida, dados)
         grafico_6_analise_estratificada(df, pasta_saida)
-        grafico_7_dashboard_completo(df, pasta_saida)
+        grafico_7_dashboard_completo(df, pasta_saida, dados)
         
         # Gerar relatório textual
         gerar_relatorio_texto(df, pasta_saida)
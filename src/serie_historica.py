@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+═══════════════════════════════════════════════════════════════════════════════
+SÉRIE HISTÓRICA - INDICADORES MUNICIPAIS POR ANO
+═══════════════════════════════════════════════════════════════════════════════
+
+Armazena os indicadores municipais (população, PIB, índices ATRICON) em um
+único array numpy indexado por (código IBGE × indicador × ano), em vez de um
+DataFrame por arquivo/ano que precisa ser carregado e mesclado a cada análise.
+
+Cada fonte bruta tem sua própria nomenclatura de colunas (`Populacao_2024`,
+`PIB_Mil_Reais`, `POPULAÇÃO ESTIMADA`...). As funções `ler_*` leem o arquivo
+bruto, as funções `registros_*` convertem cada fonte para o formato longo
+(cod_ibge, indicador, ano, valor) e `carregar_*` combinam as duas etapas. A
+classe `SerieHistorica` monta o array a partir desses registros.
+
+Anos de referência diferentes entre indicadores (PIB 2021 x população 2024)
+são resolvidos com consultas "as-of": o valor usado é o último disponível até
+o ano pedido (forward-fill ao longo do eixo dos anos).
+
+Autor: Pesquisa Framework LLM-Ready
+Data: Novembro 2025
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import pandas as pd
+import numpy as np
+from pathlib import Path
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONFIGURAÇÕES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+PASTA_RAW = Path(__file__).resolve().parent.parent / 'Data' / 'raw'
+
+CONFIG = {
+    'ARQUIVO_PIB': PASTA_RAW / 'ibge' / 'pib_municipios_rondonia_2021.csv',
+    'ARQUIVO_POPULACAO_2024': PASTA_RAW / 'ibge' / 'populacao_rondonia_2024.txt',
+    'ARQUIVO_POPULACAO_2025': PASTA_RAW / 'ibge' / 'POP2025_20251031.xls',
+    'ARQUIVO_ATRICON': PASTA_RAW / 'Atricon' / 'avaliacoes_pntp_2024' / 'avaliacoes_pntp_2024.csv',
+    'ARQUIVO_SERIE': 'serie_historica.npz',
+}
+
+# Nomes canônicos dos indicadores no array
+POPULACAO = 'Populacao'
+PIB = 'PIB_Mil_Reais'
+COLUNAS_REGISTRO = ['cod_ibge', 'indicador', 'ano', 'valor']
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# LEITURA DAS FONTES (formato longo)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _registros(cod_ibge, indicador, ano, valor):
+    """Monta um DataFrame no formato longo (cod_ibge, indicador, ano, valor)"""
+    return pd.DataFrame({
+        'cod_ibge': pd.to_numeric(cod_ibge, errors='coerce'),
+        'indicador': indicador,
+        'ano': ano,
+        'valor': pd.to_numeric(valor, errors='coerce'),
+    }).dropna(subset=['cod_ibge'])
+
+def registros_pib(df):
+    """Converte o CSV de PIB municipal (Cod_Municipio, Ano, PIB_Mil_Reais)"""
+    return _registros(df['Cod_Municipio'], PIB, df['Ano'], df['PIB_Mil_Reais'])
+
+def registros_populacao_censo(df):
+    """
+    Converte o arquivo de população no formato Cod_IBGE,Municipio,Populacao_<ano>.
+    O ano de referência vem do sufixo da coluna de população.
+    """
+    coluna = next(c for c in df.columns if c.startswith('Populacao_'))
+    ano = int(coluna.rsplit('_', 1)[1])
+    return _registros(df['Cod_IBGE'], POPULACAO, ano, df[coluna])
+
+def registros_populacao_estimada(df, ano=2025):
+    """
+    Converte a aba 'Municípios' das estimativas populacionais do IBGE.
+    O código do município é COD. UF (2 dígitos) + COD. MUNIC (5 dígitos), e a
+    população pode vir com notas de rodapé, ex.: '12345(1)'.
+    """
+    df = df.dropna(subset=['COD. UF', 'COD. MUNIC'])
+    cod_ibge = df['COD. UF'].str.strip() + df['COD. MUNIC'].str.strip().str.zfill(5)
+    populacao = df['POPULAÇÃO ESTIMADA'].str.replace(r'\D', '', regex=True)
+    return _registros(cod_ibge, POPULACAO, ano, populacao)
+
+def registros_atricon(df, indicadores=('indice_final', 'essenciais_final')):
+    """
+    Converte as avaliações ATRICON/PNTP das prefeituras (Executivo municipal).
+    Cada coluna em `indicadores` vira um indicador da série, no ano do exercício.
+    """
+    df = df[(df['poder'] == 'E') & (df['esfera'] == 'M')]
+    return pd.concat([_registros(df['ibge'], coluna, df['ano_exercicio'], df[coluna])
+                      for coluna in indicadores], ignore_index=True)
+
+def ler_pib(caminho=None):
+    """Lê o CSV de PIB municipal"""
+    return pd.read_csv(caminho or CONFIG['ARQUIVO_PIB'], encoding='utf-8-sig')
+
+def ler_populacao_censo(caminho=None):
+    """Lê o arquivo texto (CSV) de população do IBGE"""
+    return pd.read_csv(caminho or CONFIG['ARQUIVO_POPULACAO_2024'], encoding='utf-8-sig')
+
+def ler_populacao_estimada(caminho=None):
+    """Lê a aba 'Municípios' da planilha BIFF (.xls) de estimativas do IBGE"""
+    return pd.read_excel(caminho or CONFIG['ARQUIVO_POPULACAO_2025'],
+                         sheet_name='Municípios', header=1, dtype=str)
+
+def ler_atricon(caminho=None):
+    """Lê o CSV nacional de avaliações ATRICON/PNTP"""
+    return pd.read_csv(caminho or CONFIG['ARQUIVO_ATRICON'], sep=';', encoding='utf-8')
+
+def carregar_pib(caminho=None):
+    """Registros de PIB municipal lidos do CSV"""
+    return registros_pib(ler_pib(caminho))
+
+def carregar_populacao_censo(caminho=None):
+    """Registros de população lidos do arquivo Populacao_<ano>"""
+    return registros_populacao_censo(ler_populacao_censo(caminho))
+
+def carregar_populacao_estimada(caminho=None, ano=2025):
+    """Registros de população lidos da planilha de estimativas do IBGE"""
+    return registros_populacao_estimada(ler_populacao_estimada(caminho), ano)
+
+def carregar_atricon(caminho=None, indicadores=('indice_final', 'essenciais_final')):
+    """Registros ATRICON lidos do CSV nacional"""
+    return registros_atricon(ler_atricon(caminho), indicadores)
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SÉRIE HISTÓRICA
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class SerieHistorica:
+    """
+    Indicadores municipais em um array (municípios × indicadores × anos).
+
+    Posições sem dado são NaN. `codigos` e `anos` ficam ordenados, de modo que a
+    localização de um município ou ano é feita por busca binária.
+    """
+
+    def __init__(self, codigos, indicadores, anos, valores):
+        self.codigos = np.asarray(codigos, dtype=np.int64)
+        self.indicadores = list(indicadores)
+        self.anos = np.asarray(anos, dtype=np.int16)
+        self.valores = np.asarray(valores, dtype=np.float64)
+        self._preenchido = None
+
+        esperado = (len(self.codigos), len(self.indicadores), len(self.anos))
+        if self.valores.shape != esperado:
+            raise ValueError(f"Formato do array {self.valores.shape} difere de {esperado}")
+
+    def __repr__(self):
+        return (f"SerieHistorica({len(self.codigos)} municípios, "
+                f"{len(self.indicadores)} indicadores, anos {self.anos.tolist()})")
+
+    # ─── Construção ─────────────────────────────────────────────────────────
+
+    @classmethod
+    def de_registros(cls, registros):
+        """
+        Monta a série a partir de um DataFrame longo (cod_ibge, indicador, ano,
+        valor). Registros sem valor são descartados e, entre registros repetidos
+        para a mesma célula (ex.: ciclo republicado), vale o último da tabela.
+        """
+        registros = (registros[COLUNAS_REGISTRO]
+                     .dropna(subset=['cod_ibge', 'ano', 'valor'])
+                     .drop_duplicates(['cod_ibge', 'indicador', 'ano'], keep='last'))
+
+        codigos, i_mun = np.unique(registros['cod_ibge'].to_numpy(np.int64), return_inverse=True)
+        anos, i_ano = np.unique(registros['ano'].to_numpy(np.int16), return_inverse=True)
+        indicadores = pd.unique(registros['indicador'])
+        i_ind = pd.Index(indicadores).get_indexer(registros['indicador'])
+
+        valores = np.full((len(codigos), len(indicadores), len(anos)), np.nan)
+        valores[i_mun, i_ind, i_ano] = registros['valor'].to_numpy(np.float64)
+        return cls(codigos, indicadores, anos, valores)
+
+    @classmethod
+    def de_fontes(cls, *registros):
+        """Concatena os registros de várias fontes e monta uma única série"""
+        return cls.de_registros(pd.concat(registros, ignore_index=True))
+
+    @classmethod
+    def carregar_padrao(cls):
+        """Série com todas as fontes brutas configuradas em CONFIG"""
+        return cls.de_fontes(carregar_pib(),
+                             carregar_populacao_censo(),
+                             carregar_populacao_estimada(),
+                             carregar_atricon())
+
+    def salvar(self, caminho=None):
+        """Persiste a série em um único arquivo .npz comprimido"""
+        caminho = caminho or CONFIG['ARQUIVO_SERIE']
+        np.savez_compressed(caminho, codigos=self.codigos, anos=self.anos,
+                            indicadores=np.array(self.indicadores), valores=self.valores)
+        return caminho
+
+    @classmethod
+    def carregar(cls, caminho=None):
+        """Lê uma série salva com `salvar()`"""
+        with np.load(caminho or CONFIG['ARQUIVO_SERIE']) as dados:
+            return cls(dados['codigos'], dados['indicadores'].tolist(),
+                       dados['anos'], dados['valores'])
+
+    # ─── Localização ────────────────────────────────────────────────────────
+
+    def _indice_indicador(self, indicador):
+        try:
+            return self.indicadores.index(indicador)
+        except ValueError:
+            raise KeyError(f"Indicador '{indicador}' não existe na série") from None
+
+    def _indice_ano_asof(self, ano):
+        """Posição do último ano <= `ano` (-1 se anterior ao primeiro ano)"""
+        return int(np.searchsorted(self.anos, ano, side='right')) - 1
+
+    def preenchido(self):
+        """
+        Array com forward-fill ao longo dos anos: cada célula NaN recebe o último
+        valor observado em um ano anterior para o mesmo município e indicador.
+        """
+        if self._preenchido is None:
+            n_anos = len(self.anos)
+            observado = ~np.isnan(self.valores)
+            posicao = np.where(observado, np.arange(n_anos), 0)
+            np.maximum.accumulate(posicao, axis=2, out=posicao)
+            preenchido = np.take_along_axis(self.valores, posicao, axis=2)
+            # Antes da primeira observação não há valor a propagar
+            nunca_observado = ~np.logical_or.accumulate(observado, axis=2)
+            preenchido[nunca_observado] = np.nan
+            self._preenchido = preenchido
+        return self._preenchido
+
+    # ─── Consultas ──────────────────────────────────────────────────────────
+
+    def valor(self, indicador, ano, asof=True):
+        """
+        Valores de um indicador em um ano, indexados pelo código IBGE.
+        Com `asof=True` usa o último valor disponível até o ano pedido.
+        """
+        i_ind = self._indice_indicador(indicador)
+        if asof:
+            i_ano = self._indice_ano_asof(ano)
+            if i_ano < 0:
+                dados = np.full(len(self.codigos), np.nan)
+            else:
+                dados = self.preenchido()[:, i_ind, i_ano]
+        else:
+            i_ano = np.searchsorted(self.anos, ano)
+            if i_ano == len(self.anos) or self.anos[i_ano] != ano:
+                raise KeyError(f"Ano {ano} não existe na série")
+            dados = self.valores[:, i_ind, i_ano]
+        return pd.Series(dados, index=pd.Index(self.codigos, name='cod_ibge'), name=indicador)
+
+    def tabela(self, indicador, asof=False):
+        """Indicador como DataFrame municípios × anos (para gráficos de tendência)"""
+        origem = self.preenchido() if asof else self.valores
+        return pd.DataFrame(origem[:, self._indice_indicador(indicador), :],
+                            index=pd.Index(self.codigos, name='cod_ibge'),
+                            columns=pd.Index(self.anos, name='ano'))
+
+    def municipios(self, codigos):
+        """Recorte da série para um subconjunto de códigos IBGE"""
+        posicoes = np.flatnonzero(np.isin(self.codigos, codigos))
+        return SerieHistorica(self.codigos[posicoes], self.indicadores,
+                              self.anos, self.valores[posicoes])
+
+    # ─── Indicadores derivados ──────────────────────────────────────────────
+
+    def adicionar_indicador(self, nome, matriz):
+        """Inclui um indicador derivado (matriz municípios × anos) na série"""
+        matriz = np.asarray(matriz, dtype=np.float64)
+        if nome in self.indicadores:
+            self.valores[:, self._indice_indicador(nome), :] = matriz
+        else:
+            self.indicadores.append(nome)
+            self.valores = np.concatenate([self.valores, matriz[:, np.newaxis, :]], axis=1)
+        self._preenchido = None
+
+    def per_capita(self, indicador=PIB, nome='PIB_Per_Capita', escala=1000):
+        """
+        Calcula `indicador * escala / população` para todos os anos de uma vez.
+        Numerador e população usam forward-fill, então o PIB 2021 é combinado
+        com a população mais recente disponível em cada ano. A escala padrão
+        converte PIB em milhares de reais para reais por habitante.
+        """
+        preenchido = self.preenchido()
+        numerador = preenchido[:, self._indice_indicador(indicador), :]
+        populacao = preenchido[:, self._indice_indicador(POPULACAO), :]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            resultado = numerador * escala / populacao
+        resultado[~np.isfinite(resultado)] = np.nan
+        self.adicionar_indicador(nome, resultado)
+        return self.tabela(nome)
+
+    def ranking(self, indicador, asof=False, ascending=False):
+        """Posição de cada município no indicador, calculada para todos os anos"""
+        return self.tabela(indicador, asof=asof).rank(ascending=ascending, method='min')
+
+    def variacao_anual(self, indicador, asof=True):
+        """Variação percentual ano a ano do indicador (municípios × anos)"""
+        return self.tabela(indicador, asof=asof).pct_change(axis=1, fill_method=None) * 100
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FUNÇÃO PRINCIPAL
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main():
+    """Monta a série com as fontes padrão e salva em disco"""
+
+    print("\n" + "="*80)
+    print("📊 Montando série histórica de indicadores municipais...")
+    print("="*80)
+
+    serie = SerieHistorica.carregar_padrao()
+    serie.per_capita()
+
+    print(f"✓ {serie}")
+    print(f"✓ Indicadores: {', '.join(serie.indicadores)}")
+    print(f"✓ Memória do array: {serie.valores.nbytes / 1024**2:,.1f} MB")
+
+    arquivo = serie.salvar()
+    print(f"✓ Salvo: {arquivo}")
+
+if __name__ == "__main__":
+    main()